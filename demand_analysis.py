@@ -14,10 +14,29 @@ Inputs (expected columns):
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import holidays
 
+from io_helpers import EXCEL_ENGINE_KWARGS, cache_on_disk, write_parquet
+
+# Optional DuckDB engine for the grouped summaries
+try:
+    import duckdb
+except Exception:
+    duckdb = None
+
+# Optional Rust-based xlsx reader (pandas falls back to openpyxl)
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = "calamine"
+except Exception:
+    EXCEL_READ_ENGINE = None
+
 
 # -----------------------------
 # Config
@@ -26,6 +45,8 @@ DATA_PATH = Path("data/Daily Shopping trips and quantity since Jan 2017.xlsx")
 OUTPUT_DIR = Path("outputs")
 OUTPUT_FILE = OUTPUT_DIR / "Insight.xlsx"
 
+INPUT_COLUMNS = ["Date", "Shopping Trips by Day", "Quantity (lbs) by Day"]
+
 YEARS_FOR_HOLIDAYS = range(2017, 2030)
 
 SEASONS = {1: "Winter", 2: "Spring", 3: "Summer", 4: "Autumn"}
@@ -33,14 +54,47 @@ MONTH_ORDER = [
     "January", "February", "March", "April", "May", "June",
     "July", "August", "September", "October", "November", "December"
 ]
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 SEASON_ORDER = ["Winter", "Spring", "Summer", "Autumn"]
 
+# "pandas" or "duckdb" (requires the optional duckdb package)
+ENGINE = "pandas"
+
 
 # -----------------------------
 # Helpers
 # -----------------------------
+def read_daily_log(path: Path) -> pd.DataFrame:
+    """Read the raw daily log, reusing a .parquet copy of the same workbook when there is one."""
+    cache = path.parent / ".cache" / f"{path.stem}.raw.parquet"
+    # Same file identity as cache_on_disk, so a replaced workbook is never
+    # served from an older copy (even if its mtime went backwards)
+    st = path.stat()
+    key = f"{st.st_mtime_ns}|{st.st_size}".encode()
+
+    if cache.exists() and pq.read_schema(cache).metadata.get(b"source_key") == key:
+        return pd.read_parquet(cache, dtype_backend="pyarrow")
+
+    df = pd.read_excel(
+        path,
+        engine=EXCEL_READ_ENGINE,
+        usecols=lambda c: c in INPUT_COLUMNS,
+        dtype_backend="pyarrow",
+    )
+    # A read-only data folder just means no copy
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b"source_key": key})
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, cache)
+    except OSError:
+        pass
+    return df
+
+
+@cache_on_disk
 def load_and_clean_data(path: Path) -> pd.DataFrame:
-    df = pd.read_excel(path)
+    df = read_daily_log(path)
 
     if "Date" not in df.columns:
         raise ValueError("Expected a 'Date' column in the input file.")
@@ -53,18 +107,29 @@ def load_and_clean_data(path: Path) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
+    # Small non-negative values; float32 halves the bytes every aggregation reads
+    df[list(required)] = df[list(required)].astype("float32")
+
     # Feature engineering
     df["lbs_per_visit"] = df["Quantity (lbs) by Day"] / df["Shopping Trips by Day"]
-    df["Day_of_week"] = df.index.day_name()
-    df["Month"] = df.index.month_name()
+    # Ordered categoricals: int codes instead of per-row name strings
+    df["Day_of_week"] = pd.Categorical.from_codes(df.index.dayofweek, categories=DAY_ORDER, ordered=True)
+    df["Month"] = pd.Categorical.from_codes(df.index.month - 1, categories=MONTH_ORDER, ordered=True)
     df["Year"] = df.index.year
     df["quarter"] = df.index.quarter
     df["Season"] = df["quarter"].map(SEASONS)
 
     # Holiday flags (Canada)
-    ca_holidays = holidays.Canada(years=YEARS_FOR_HOLIDAYS)
-    df["is_holiday"] = df.index.to_series().dt.date.isin(ca_holidays)
-    df["holiday_name"] = df.index.map(ca_holidays.get)
+    # Match on datetime64[D] arrays; avoids boxing every row into a datetime.date
+    hmap = dict(sorted(holidays.Canada(years=YEARS_FOR_HOLIDAYS).items()))
+    holiday_days = np.array(list(hmap), dtype="datetime64[D]")
+    holiday_names = np.array(list(hmap.values()), dtype=object)
+
+    days = df.index.values.astype("datetime64[D]")
+    pos = np.searchsorted(holiday_days, days).clip(max=len(holiday_days) - 1)
+    is_holiday = holiday_days[pos] == days
+    df["is_holiday"] = is_holiday
+    df["holiday_name"] = np.where(is_holiday, holiday_names[pos], np.nan)
 
     # Basic outlier score on pounds distributed
     df["z_score_lbs"] = (
@@ -75,62 +140,56 @@ def load_and_clean_data(path: Path) -> pd.DataFrame:
     return df
 
 
-def classify_volatility(cv: float) -> str:
-    if cv < 0.10:
-        return "Very Low Volatility"
-    if cv < 0.20:
-        return "Low Volatility"
-    if cv < 0.40:
-        return "Moderate Volatility"
-    if cv < 0.60:
-        return "High Volatility"
-    return "Very High Volatility"
+VOLATILITY_BINS = [0.10, 0.20, 0.40, 0.60]
+VOLATILITY_LABELS = np.array([
+    "Very Low Volatility",
+    "Low Volatility",
+    "Moderate Volatility",
+    "High Volatility",
+    "Very High Volatility",
+])
+
+
+def classify_volatility(cv: np.ndarray) -> np.ndarray:
+    # One label per CV; NaN (undefined CV) is labelled "NA"
+    cv = np.asarray(cv, dtype=float)
+    labels = VOLATILITY_LABELS[np.searchsorted(VOLATILITY_BINS, cv, side="right")]
+    return np.where(np.isnan(cv), "NA", labels)
 
 
 # -----------------------------
 # Analysis blocks
 # -----------------------------
 def daily_summary(df: pd.DataFrame) -> pd.DataFrame:
-    visits = df["Shopping Trips by Day"]
-    lbs = df["Quantity (lbs) by Day"]
-    ppv = df["lbs_per_visit"]
-
     unusual_high = df[df["z_score_lbs"] > 3]
     unusual_low = df[df["z_score_lbs"] < -3]
 
-    def stats(series: pd.Series) -> dict:
-        mean = series.mean()
-        std = series.std()
-        cv = std / mean if mean != 0 else float("nan")
-        return {
-            "mean": mean,
-            "std": std,
-            "cv": cv,
-            "volatility_label": classify_volatility(cv) if pd.notna(cv) else "NA",
-        }
-
-    visits_stats = stats(visits)
-    lbs_stats = stats(lbs)
-    ppv_stats = stats(ppv)
+    # visits, lbs, lbs per visit: mean/std/CV/label for all three at once
+    stats = df[["Shopping Trips by Day", "Quantity (lbs) by Day", "lbs_per_visit"]].agg(["mean", "std"])
+    mean = stats.loc["mean"].to_numpy()
+    std = stats.loc["std"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cv = np.where(mean != 0, std / mean, np.nan)
+    volatility = classify_volatility(cv)
 
     summary = pd.DataFrame([{
-        "avg_daily_visits": visits.mean(),
-        "avg_lbs_per_visit": ppv.mean(),
+        "avg_daily_visits": mean[0],
+        "avg_lbs_per_visit": mean[2],
 
-        "visits_mean": visits_stats["mean"],
-        "visits_std": visits_stats["std"],
-        "visits_cv": visits_stats["cv"],
-        "visits_volatility": visits_stats["volatility_label"],
+        "visits_mean": mean[0],
+        "visits_std": std[0],
+        "visits_cv": cv[0],
+        "visits_volatility": volatility[0],
 
-        "lbs_mean": lbs_stats["mean"],
-        "lbs_std": lbs_stats["std"],
-        "lbs_cv": lbs_stats["cv"],
-        "lbs_volatility": lbs_stats["volatility_label"],
+        "lbs_mean": mean[1],
+        "lbs_std": std[1],
+        "lbs_cv": cv[1],
+        "lbs_volatility": volatility[1],
 
-        "ppv_mean": ppv_stats["mean"],
-        "ppv_std": ppv_stats["std"],
-        "ppv_cv": ppv_stats["cv"],
-        "ppv_volatility": ppv_stats["volatility_label"],
+        "ppv_mean": mean[2],
+        "ppv_std": std[2],
+        "ppv_cv": cv[2],
+        "ppv_volatility": volatility[2],
 
         # NOTE: for public repo, we do not export specific outlier dates
         "unusual_high_count": len(unusual_high),
@@ -141,8 +200,8 @@ def daily_summary(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def weekly_summary(df: pd.DataFrame) -> pd.DataFrame:
-    demand = df.groupby("Day_of_week")["Shopping Trips by Day"].sum()
-    dist = df.groupby("Day_of_week")["Quantity (lbs) by Day"].sum()
+    demand = df.groupby("Day_of_week", observed=True)["Shopping Trips by Day"].sum()
+    dist = df.groupby("Day_of_week", observed=True)["Quantity (lbs) by Day"].sum()
 
     demand_pct = demand / demand.sum()
     dist_pct = dist / dist.sum()
@@ -155,39 +214,83 @@ def weekly_summary(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
-def monthly_summary(df: pd.DataFrame) -> pd.DataFrame:
-    avg_demand = df.groupby("Month")["Shopping Trips by Day"].mean()
-    avg_dist = df.groupby("Month")["Quantity (lbs) by Day"].mean()
-    avg_ppv = df.groupby("Month")["lbs_per_visit"].mean()
-
-    std_demand = df.groupby("Month")["Shopping Trips by Day"].std()
-    std_dist = df.groupby("Month")["Quantity (lbs) by Day"].std()
-    std_ppv = df.groupby("Month")["lbs_per_visit"].std()
-
-    cv_demand = std_demand / avg_demand
-    cv_dist = std_dist / avg_dist
-    cv_ppv = std_ppv / avg_ppv
+# SQL per aggregate, {c} = quoted column. DuckDB's STDDEV_SAMP raises on
+# +-inf (e.g. lbs_per_visit on a zero-trip day), so it skips them and the
+# group's std is NaN instead, as in pandas; AVG/SUM already give inf/NaN.
+SQL_AGGS = {
+    "mean": "AVG({c})",
+    "std": "CASE WHEN bool_or(isinf({c}::DOUBLE)) THEN 'NaN'::DOUBLE "
+           "ELSE STDDEV_SAMP({c}) FILTER (WHERE NOT isinf({c}::DOUBLE)) END",
+    "sum": "SUM({c})",
+}
+
+
+def group_stats(
+    df: pd.DataFrame,
+    by: str,
+    cols: list[str],
+    funcs: list[str],
+    engine: str = "pandas",
+) -> pd.DataFrame:
+    """
+    Per-group `funcs` of `cols` in one pass; columns are (column, func).
+
+    Both engines return the same frame. Infinite values (zero-trip days in
+    lbs_per_visit) are kept as in pandas: mean/sum become inf and std NaN.
+    """
+    if engine == "pandas":
+        return df.groupby(by, observed=True)[cols].agg(funcs)
+
+    if engine == "duckdb":
+        if duckdb is None:
+            raise ImportError("engine='duckdb' requires the duckdb package.")
+
+        select = ", ".join(
+            "(" + SQL_AGGS[f].format(c=f'"{c}"') + f')::DOUBLE AS "{c}|{f}"' for c in cols for f in funcs
+        )
+        with duckdb.connect() as con:
+            con.register("df", df[[by, *cols]].reset_index(drop=True))
+            out = con.sql(f'SELECT "{by}", {select} FROM df GROUP BY "{by}" ORDER BY "{by}"').df()
+
+        # Match the pandas path's dtypes: group key as in `df`, float stats
+        # at the input's float width (float32 stays float32)
+        out = out.set_index(by)
+        out.index = out.index.astype(df[by].dtype)
+        out = out.astype({
+            f"{c}|{f}": df[c].dtype if pd.api.types.is_float_dtype(df[c]) else "float64"
+            for c in cols for f in funcs
+        })
+        out.columns = pd.MultiIndex.from_tuples([tuple(c.rsplit("|", 1)) for c in out.columns])
+        return out
+
+    raise ValueError(f"Unknown engine: {engine!r}")
+
+
+def monthly_summary(df: pd.DataFrame, engine: str = "pandas") -> pd.DataFrame:
+    demand, dist, ppv = "Shopping Trips by Day", "Quantity (lbs) by Day", "lbs_per_visit"
+    stats = group_stats(df, "Month", [demand, dist, ppv], ["mean", "std"], engine)
 
     result = pd.DataFrame({
-        "avg_demand": avg_demand,
-        "std_demand": std_demand,
-        "cv_demand": cv_demand,
-        "avg_dist": avg_dist,
-        "std_dist": std_dist,
-        "cv_dist": cv_dist,
-        "avg_lbs_per_visit": avg_ppv,
-        "std_lbs_per_visit": std_ppv,
-        "cv_lbs_per_visit": cv_ppv,
+        "avg_demand": stats[(demand, "mean")],
+        "std_demand": stats[(demand, "std")],
+        "cv_demand": stats[(demand, "std")] / stats[(demand, "mean")],
+        "avg_dist": stats[(dist, "mean")],
+        "std_dist": stats[(dist, "std")],
+        "cv_dist": stats[(dist, "std")] / stats[(dist, "mean")],
+        "avg_lbs_per_visit": stats[(ppv, "mean")],
+        "std_lbs_per_visit": stats[(ppv, "std")],
+        "cv_lbs_per_visit": stats[(ppv, "std")] / stats[(ppv, "mean")],
     }).reindex(MONTH_ORDER)
 
     return result
 
 
-def seasonal_summary(df: pd.DataFrame) -> pd.DataFrame:
-    grp = df.groupby("Season")[["Shopping Trips by Day", "Quantity (lbs) by Day", "lbs_per_visit"]]
+def seasonal_summary(df: pd.DataFrame, engine: str = "pandas") -> pd.DataFrame:
+    cols = ["Shopping Trips by Day", "Quantity (lbs) by Day", "lbs_per_visit"]
+    stats = group_stats(df, "Season", cols, ["mean", "std"], engine)
 
-    avg = grp.mean()
-    std = grp.std()
+    avg = stats.xs("mean", axis=1, level=1)
+    std = stats.xs("std", axis=1, level=1)
     cv = std / avg
 
     out = pd.concat(
@@ -202,13 +305,18 @@ def seasonal_summary(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
-def yearly_summary(df: pd.DataFrame) -> pd.DataFrame:
-    yearly = df.groupby("Year")[["Shopping Trips by Day", "Quantity (lbs) by Day"]].sum()
+def yearly_summary(df: pd.DataFrame, engine: str = "pandas") -> pd.DataFrame:
+    cols = ["Shopping Trips by Day", "Quantity (lbs) by Day"]
+    yearly = group_stats(df, "Year", cols, ["sum"], engine).xs("sum", axis=1, level=1)
     yearly["lbs_per_visit"] = yearly["Quantity (lbs) by Day"] / yearly["Shopping Trips by Day"]
 
     # YoY growth (kept numeric; avoid formatting into strings)
-    yearly["yoy_demand_growth"] = yearly["Shopping Trips by Day"].pct_change()
-    yearly["yoy_distribution_growth"] = yearly["Quantity (lbs) by Day"].pct_change()
+    arr = yearly[cols].to_numpy(dtype=float)
+    growth = np.empty_like(arr)
+    growth[:1] = np.nan
+    growth[1:] = arr[1:] / arr[:-1] - 1
+    yearly["yoy_demand_growth"] = growth[:, 0]
+    yearly["yoy_distribution_growth"] = growth[:, 1]
 
     return yearly
 
@@ -225,12 +333,28 @@ def export_insights(
 ) -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    with pd.ExcelWriter(OUTPUT_FILE, engine="openpyxl", mode="w") as writer:
-        daily.to_excel(writer, sheet_name="Daily", index=False)
-        weekly.to_excel(writer, sheet_name="Weekly", index=True)
-        monthly.to_excel(writer, sheet_name="Monthly", index=True)
-        seasonal.to_excel(writer, sheet_name="Seasonal", index=True)
-        yearly.to_excel(writer, sheet_name="Yearly", index=True)
+    # sheet name -> (table, keep index)
+    sheets = {
+        "Daily": (daily, False),
+        "Weekly": (weekly, True),
+        "Monthly": (monthly, True),
+        "Seasonal": (seasonal, True),
+        "Yearly": (yearly, True),
+    }
+
+    # Parquet copies (outputs/<sheet>.parquet) are written alongside the workbook
+    with ThreadPoolExecutor() as pool:
+        futures = [
+            pool.submit(write_parquet, table, OUTPUT_DIR, name, index)
+            for name, (table, index) in sheets.items()
+        ]
+
+        with pd.ExcelWriter(OUTPUT_FILE, engine="xlsxwriter", engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
+            for name, (table, index) in sheets.items():
+                table.to_excel(writer, sheet_name=name, index=index)
+
+        for future in futures:
+            future.result()
 
 
 def main() -> None:
@@ -238,9 +362,9 @@ def main() -> None:
 
     daily = daily_summary(df)
     weekly = weekly_summary(df)
-    monthly = monthly_summary(df)
-    seasonal = seasonal_summary(df)
-    yearly = yearly_summary(df)
+    monthly = monthly_summary(df, engine=ENGINE)
+    seasonal = seasonal_summary(df, engine=ENGINE)
+    yearly = yearly_summary(df, engine=ENGINE)
 
     export_insights(daily, weekly, monthly, seasonal, yearly)
     print(f"Done. Aggregated summaries exported to: {OUTPUT_FILE}")
@@ -0,0 +1,80 @@
+"""
+Shared I/O helpers for the analysis scripts.
+
+- cache_on_disk: parquet memoization of the row-level load & clean step.
+  Cache files live in a .cache folder next to the input file (i.e. under
+  data/), never under outputs/, since they hold cleaned row-level logs.
+- write_parquet / EXCEL_ENGINE_KWARGS: summary table export settings.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import functools
+import hashlib
+import inspect
+import re
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# xlsxwriter's constant_memory mode is not used: pandas writes cells column by
+# column, and constant_memory silently drops cells written out of row order.
+EXCEL_ENGINE_KWARGS = {"options": {"strings_to_urls": False}}
+
+
+def cache_on_disk(fn):
+    """Memoize a `fn(path) -> DataFrame` loader as parquet in <input dir>/.cache."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> pd.DataFrame:
+        bound = inspect.signature(fn).bind(*args, **kwargs)
+        bound.apply_defaults()
+        path = Path(next(iter(bound.arguments.values())))
+        cache_dir = path.parent / ".cache"
+
+        # Key on the input file and on the loader's module source, so editing
+        # the cleaning code (or any helper it calls) invalidates the cache.
+        # No readable source (e.g. run as __main__ via runpy, loaded from a
+        # file spec, shipped as .pyc) or no input file just means no cache
+        try:
+            st = path.stat()
+            source = inspect.getsource(inspect.getmodule(fn))
+        except (OSError, TypeError):
+            return fn(*bound.args, **bound.kwargs)
+        prefix = f"{fn.__qualname__}-{hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:8]}"
+        key = f"{st.st_mtime_ns}|{st.st_size}|{hashlib.sha1(source.encode()).hexdigest()}"
+        cached = cache_dir / f"{prefix}-{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+
+        if cached.exists():
+            df = pd.read_parquet(cached, engine="pyarrow")
+            # Parquet only keeps string categoricals; re-cast numeric ones (e.g. IDs)
+            for col in pq.read_schema(cached).pandas_metadata["columns"]:
+                name = col["name"]
+                if col["pandas_type"] == "categorical" and name in df.columns and df[name].dtype != "category":
+                    df[name] = df[name].astype("category")
+            return df
+
+        df = fn(*bound.args, **bound.kwargs)
+
+        # A read-only data folder just means no cache
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in cache_dir.glob(f"{prefix}-*.parquet"):
+                stale.unlink()
+            df.to_parquet(cached, engine="pyarrow", compression="zstd")
+        except OSError:
+            pass
+        return df
+
+    return wrapper
+
+
+def write_parquet(df: pd.DataFrame, output_dir: Path, sheet_name: str, index: bool) -> None:
+    """Write one summary table to <output_dir>/<sheet_name as snake_case>.parquet."""
+    stem = re.sub(r"[^0-9a-z]+", "_", sheet_name.lower()).strip("_")
+    if isinstance(df.columns, pd.CategoricalIndex):
+        # pyarrow cannot restore categorical column labels on read
+        df = df.set_axis(df.columns.astype(str), axis=1)
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    pq.write_table(table, output_dir / f"{stem}.parquet", compression="zstd")
@@ -10,11 +10,13 @@ Purpose:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import math
 import numpy as np
 import pandas as pd
 
+from io_helpers import EXCEL_ENGINE_KWARGS, cache_on_disk, write_parquet
+
 # Optional mapping dependencies
 try:
     import geopandas as gpd
@@ -23,6 +25,12 @@ except Exception:
     gpd = None
     plt = None
 
+# Optional DuckDB engine for the retention query
+try:
+    import duckdb
+except Exception:
+    duckdb = None
+
 
 # -----------------------------
 # Config
@@ -38,14 +46,30 @@ FSA_SHP = DATA_DIR / "lfsa000b21a_e.shp"
 
 OUTPUT_FILE = OUTPUT_DIR / "Volunteer_Engagement_Analysis.xlsx"
 
-SEASONS = {1: "Winter", 2: "Spring", 3: "Summer", 4: "Autumn"}
 MONTH_ORDER = ["January","February","March","April","May","June","July","August","September","October","November","December"]
 DAY_ORDER = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"]
+SEASON_ORDER = ["Winter","Spring","Summer","Autumn"]
+
+# Groupby engine for the numeric reductions: "cython" or "numba" (requires the
+# optional numba package and adds several seconds of JIT compilation per run;
+# its parallel kernels can only pay that back on a multi-core machine)
+GROUPBY_ENGINE = "cython"
+
+# Retention engine: "pandas" or "duckdb" (requires the optional duckdb package)
+RETENTION_ENGINE = "pandas"
+
+# How main() runs the independent metrics: "serial" or "threads" (one thread
+# pool; pandas releases the GIL in its C kernels, so this only helps on
+# multi-core machines)
+METRICS_EXECUTOR = "serial"
 
 
 # -----------------------------
 # Cleaning helpers
 # -----------------------------
+# Cleaned text columns use pyarrow strings with pd.NA (fast hashing in groupby)
+STRING_DTYPE = "string[pyarrow]"
+
 CITY_CANONICAL_MAP = {
     "mississauga": "Mississauga",
     "missisauga": "Mississauga",
@@ -61,72 +85,56 @@ CITY_CANONICAL_MAP = {
 }
 
 
-def clean_city(city) -> str | float:
-    if pd.isna(city):
-        return np.nan
-
-    s = str(city).strip().lower()
-
-    if "," in s:
-        s = s.split(",")[0].strip()
-
-    for suffix in [" on", " ab", " bc", " can", " canada", " ontario"]:
-        if s.endswith(suffix):
-            s = s.replace(suffix, "").strip()
+def clean_city(city: pd.Series) -> pd.Series:
+    s = city.astype(STRING_DTYPE).str.strip().str.lower()
+    s = s.str.split(",", n=1).str[0].str.strip()
+    s = s.str.replace(r"(?:\s+(?:on|ab|bc|can|canada|ontario))+$", "", regex=True).str.strip()
 
-    if s.startswith("mis"):
-        return "Mississauga"
+    s = s.mask(s.str.startswith("mis", na=False), "mississauga")
 
-    if s in CITY_CANONICAL_MAP:
-        return CITY_CANONICAL_MAP[s]
+    return s.map(CITY_CANONICAL_MAP).fillna(s.str.title()).astype(STRING_DTYPE)
 
-    return s.title()
 
+def clean_volunteer_status(status: pd.Series) -> pd.Series:
+    s = status.astype(STRING_DTYPE).str.strip().str.lower()
 
-def clean_volunteer_status(status) -> str:
-    if pd.isna(status):
-        return "Unknown"
-
-    s = str(status).strip().lower()
-
-    if "applicant" in s:
-        return "Applicant"
-    if "process" in s:
-        return "In Process"
-    if "accepted" in s:
-        return "Accepted"
-    if "inactive" in s:
-        return "Inactive"
-    if "archived" in s:
-        return "Archived"
-    return "Other"
-
+    labels = np.select(
+        [
+            s.isna(),
+            s.str.contains("applicant", regex=False, na=False),
+            s.str.contains("process", regex=False, na=False),
+            s.str.contains("accepted", regex=False, na=False),
+            s.str.contains("inactive", regex=False, na=False),
+            s.str.contains("archived", regex=False, na=False),
+        ],
+        ["Unknown", "Applicant", "In Process", "Accepted", "Inactive", "Archived"],
+        default="Other",
+    )
+    return pd.Series(labels, index=status.index, dtype=STRING_DTYPE)
 
-def extract_fsa(postal) -> str | float:
-    if pd.isna(postal):
-        return np.nan
-    s = str(postal).replace(" ", "").upper()
-    return s[:3] if len(s) >= 3 else np.nan
 
+def extract_fsa(postal: pd.Series) -> pd.Series:
+    fsa = postal.astype(STRING_DTYPE).str.replace(" ", "", regex=False).str.upper().str[:3]
+    return fsa.where(fsa.str.len().ge(3))
 
-def classify_language(text: str) -> str:
-    if text.strip() == "":
-        return "Other/Unknown"
 
-    t = text.lower()
-    has_english = "english" in t
-    is_multi = any(sep in t for sep in [",", ";", " and ", "/"])
+def classify_language(text: pd.Series) -> pd.Series:
+    t = text.astype(STRING_DTYPE).str.lower()
+    has_english = t.str.contains("english", regex=False, na=False)
+    is_multi = t.str.contains(r"[,;/]| and ", regex=True, na=False)
 
-    if has_english and is_multi:
-        return "Multilingual"
-    if has_english:
-        return "English only"
-    return "Other/Unknown"
+    labels = np.select(
+        [has_english & is_multi, has_english],
+        ["Multilingual", "English only"],
+        default="Other/Unknown",
+    )
+    return pd.Series(labels, index=text.index, dtype=STRING_DTYPE)
 
 
 # -----------------------------
 # Load & clean
 # -----------------------------
+@cache_on_disk
 def load_and_clean_hours(path: Path = HOURS_FILE) -> pd.DataFrame:
     df = pd.read_csv(path)
 
@@ -138,11 +146,15 @@ def load_and_clean_hours(path: Path = HOURS_FILE) -> pd.DataFrame:
     df = df.dropna(subset=["DateVolunteered"])
 
     df["Year"] = df["DateVolunteered"].dt.year
-    df["Month"] = df["DateVolunteered"].dt.month_name()
-    df["DayName"] = df["DateVolunteered"].dt.day_name()
+    df["Month"] = pd.Categorical.from_codes(
+        df["DateVolunteered"].dt.month - 1, categories=MONTH_ORDER, ordered=True
+    )
+    df["DayName"] = pd.Categorical.from_codes(
+        df["DateVolunteered"].dt.dayofweek, categories=DAY_ORDER, ordered=True
+    )
     df["Quarter"] = df["DateVolunteered"].dt.quarter
     df["Week"] = df["DateVolunteered"].dt.isocalendar().week.astype(int)
-    df["Season"] = df["Quarter"].map(SEASONS)
+    df["Season"] = pd.Categorical.from_codes(df["Quarter"] - 1, categories=SEASON_ORDER, ordered=True)
 
     # Rename to stable names
     df = df.rename(columns={
@@ -152,6 +164,9 @@ def load_and_clean_hours(path: Path = HOURS_FILE) -> pd.DataFrame:
         "EventSubcategory": "SubCategory",
     })
 
+    # Hours are small and at most 2 decimals; float32 halves groupby-sum traffic
+    df["Hours"] = df["Hours"].astype("float32")
+
     # Basic filters (your intent preserved)
     df["Category"] = df["Category"].replace({"Market/Ware house Operation": "Market/Warehouse"})
     df = df[df["Year"] != 2016]
@@ -162,6 +177,9 @@ def load_and_clean_hours(path: Path = HOURS_FILE) -> pd.DataFrame:
     keep = ["Volunteer ID", "DateVolunteered", "Year", "Month", "DayName", "Week", "Season", "Category", "SubCategory", "Hours"]
     df = df[[c for c in keep if c in df.columns]]
 
+    # Group key for nearly every metric; categorical codes hash faster than raw IDs
+    df["Volunteer ID"] = df["Volunteer ID"].astype("category")
+
     return df
 
 
@@ -188,10 +206,21 @@ def merge_volunteer_data(df_hours: pd.DataFrame, path: Path = VOLUNTEER_FILE) ->
     ]
     df_vol = df_vol[[c for c in vol_cols if c in df_vol.columns]]
 
-    df_vol["City"] = df_vol["City"].apply(clean_city)
-    df_vol["VolunteerStatus"] = df_vol["VolunteerStatus"].apply(clean_volunteer_status)
-    df_vol["FSA"] = df_vol["PostalCode"].apply(extract_fsa)
-
+    df_vol["City"] = clean_city(df_vol["City"])
+    df_vol["VolunteerStatus"] = clean_volunteer_status(df_vol["VolunteerStatus"])
+    df_vol["FSA"] = extract_fsa(df_vol["PostalCode"])
+
+    # Match the hours-side categorical so the merge joins on codes; IDs with no
+    # logged hours would be dropped by the left merge anyway
+    id_dtype = df_hours["Volunteer ID"].dtype
+    hours_numeric = pd.api.types.is_numeric_dtype(id_dtype.categories.dtype)
+    if hours_numeric != pd.api.types.is_numeric_dtype(df_vol["Volunteer ID"].dtype):
+        raise ValueError(
+            "Volunteer ID types differ between the hours file "
+            f"({id_dtype.categories.dtype}) and the volunteer file ({df_vol['Volunteer ID'].dtype})."
+        )
+    df_vol = df_vol[df_vol["Volunteer ID"].isin(id_dtype.categories)].copy()
+    df_vol["Volunteer ID"] = df_vol["Volunteer ID"].astype(id_dtype)
     df_merged = df_hours.merge(df_vol, on="Volunteer ID", how="left")
     return df_merged
 
@@ -199,78 +228,141 @@ def merge_volunteer_data(df_hours: pd.DataFrame, path: Path = VOLUNTEER_FILE) ->
 # -----------------------------
 # Metrics
 # -----------------------------
-def compute_yearly_engagement(df: pd.DataFrame) -> pd.DataFrame:
-    totals = df.groupby(["Year", "Volunteer ID"])["Hours"].sum().reset_index()
-    desc = totals.groupby("Year")["Hours"].describe().reset_index()
-    desc = desc.rename(columns={"count": "VolunteerCount"})
+def engine_kwargs(engine: str, numba_parallel: bool = True) -> dict:
+    if engine == "numba":
+        return {"engine": "numba", "engine_kwargs": {"parallel": numba_parallel}}
+    if engine == "cython":
+        return {}
+    raise ValueError(f"Unknown groupby engine: {engine!r}")
+
+
+def compute_yearly_engagement(
+    df: pd.DataFrame, engine: str = "cython", numba_parallel: bool = True
+) -> pd.DataFrame:
+    kw = engine_kwargs(engine, numba_parallel)
+    totals = df.groupby(["Year", "Volunteer ID"], observed=True)["Hours"].sum(**kw)
+    grp = totals.groupby(level="Year")
+
+    # Explicit reductions instead of describe(); quantiles have no numba kernel
+    desc = pd.DataFrame({
+        "VolunteerCount": grp.count().astype(float),
+        "mean": grp.mean(**kw),
+        "std": grp.std(**kw),
+        "min": grp.min(**kw),
+        "25%": grp.quantile(0.25),
+        "50%": grp.quantile(0.50),
+        "75%": grp.quantile(0.75),
+        "max": grp.max(**kw),
+    }).reset_index()
     return desc
 
 
 def compute_top20_engagement(df: pd.DataFrame) -> pd.DataFrame:
-    rows = []
-    for yr in sorted(df["Year"].unique()):
-        df_y = df[df["Year"] == yr]
-        totals = df_y.groupby("Volunteer ID")["Hours"].sum().sort_values(ascending=False)
-        if totals.empty:
-            continue
-
-        n_vol = len(totals)
-        top_n = math.ceil(0.20 * n_vol)
-        top20 = totals.iloc[:top_n]
-        other80 = totals.iloc[top_n:]
-
-        rows.append({
-            "Year": yr,
-            "Total Volunteers": n_vol,
-            "Top 20% Volunteers": top_n,
-            "Total Hours": totals.sum(),
-            "Top 20% Hours": top20.sum(),
-            "Top 20% Share (%)": (top20.sum() / totals.sum()) * 100,
-            "Mean Hours (Top 20%)": top20.mean(),
-            "Mean Hours (Other 80%)": other80.mean() if len(other80) else 0,
-        })
+    totals = df.groupby(["Year", "Volunteer ID"], observed=True, sort=False)["Hours"].sum().reset_index()
+
+    # Rank volunteers within each year; top 20% = first ceil(0.2 * n) by hours
+    rank = totals.groupby("Year")["Hours"].rank(method="first", ascending=False)
+    n_vol = totals.groupby("Year")["Hours"].transform("size")
+    totals["is_top"] = rank <= np.ceil(0.20 * n_vol)
+    totals["top_hours"] = totals["Hours"].where(totals["is_top"], 0)
+    totals["other_hours"] = totals["Hours"].where(~totals["is_top"], 0)
+
+    agg = totals.groupby("Year").agg(
+        total_vol=("Volunteer ID", "size"),
+        total_hours=("Hours", "sum"),
+        top_hours=("top_hours", "sum"),
+        other_hours=("other_hours", "sum"),
+        top_n=("is_top", "sum"),
+    )
+    other_n = agg["total_vol"] - agg["top_n"]
+
+    out = pd.DataFrame({
+        "Year": agg.index,
+        "Total Volunteers": agg["total_vol"].values,
+        "Top 20% Volunteers": agg["top_n"].values,
+        "Total Hours": agg["total_hours"].values,
+        "Top 20% Hours": agg["top_hours"].values,
+        "Top 20% Share (%)": (agg["top_hours"] / agg["total_hours"] * 100).values,
+        "Mean Hours (Top 20%)": (agg["top_hours"] / agg["top_n"]).values,
+        "Mean Hours (Other 80%)": (agg["other_hours"] / other_n.where(other_n > 0)).fillna(0).values,
+    })
 
-    return pd.DataFrame(rows)
+    return out
 
 
-def compute_retention_rolling_6mo(df: pd.DataFrame) -> pd.DataFrame:
+def compute_retention_rolling_6mo(df_nt: pd.DataFrame, engine: str = "pandas") -> pd.DataFrame:
     """
-    Rolling inactivity rule:
+    Rolling inactivity rule (df_nt = hours excluding Training):
     - For each year, consider volunteers who had at least one shift in that year.
     - Inactive if last shift in that year is >180 days before Dec 31.
     """
-    df_nt = df[df["Category"] != "Training"].copy()
     threshold_days = 180
 
-    rows = []
-    for yr in sorted(df_nt["Year"].unique()):
-        df_y = df_nt[df_nt["Year"] == yr]
-        if df_y.empty:
-            continue
-
-        year_end = pd.Timestamp(year=yr, month=12, day=31)
-        last_shift = df_y.groupby("Volunteer ID")["DateVolunteered"].max()
-        inactivity_days = (year_end - last_shift).dt.days
-
-        inactive = inactivity_days > threshold_days
-        total = len(last_shift)
-
-        rows.append({
-            "Year": yr,
-            "Total Volunteers": total,
-            "Active Volunteers": int((~inactive).sum()),
-            "Inactive Volunteers": int(inactive.sum()),
-            "Active (%)": float((~inactive).sum()) / total * 100 if total else 0,
-            "Inactive (%)": float(inactive.sum()) / total * 100 if total else 0,
+    if engine == "pandas":
+        last = df_nt.groupby(["Year", "Volunteer ID"], observed=True)["DateVolunteered"].max().reset_index()
+        year_end = pd.to_datetime(pd.DataFrame({"year": last["Year"], "month": 12, "day": 31}))
+        last["inactive"] = (year_end - last["DateVolunteered"]).dt.days > threshold_days
+
+        counts = last.groupby("Year").agg(
+            total=("Volunteer ID", "size"),
+            inactive=("inactive", "sum"),
+        )
+    elif engine == "duckdb":
+        if duckdb is None:
+            raise ImportError("engine='duckdb' requires the duckdb package.")
+
+        # Category codes stand in for the IDs (-1 = missing, dropped like pandas does);
+        # "> N whole days" is the same as "at least N + 1 days"
+        ids = pd.DataFrame({
+            "Year": df_nt["Year"].to_numpy(),
+            "vid": df_nt["Volunteer ID"].cat.codes.to_numpy(),
+            "DateVolunteered": df_nt["DateVolunteered"].to_numpy(),
         })
+        with duckdb.connect() as con:
+            con.register("df", ids)
+            counts = con.sql(f"""
+                SELECT "Year",
+                       COUNT(*) AS total,
+                       COUNT(*) FILTER (
+                           WHERE last <= make_date("Year", 12, 31) - INTERVAL {threshold_days + 1} DAY
+                       ) AS inactive
+                FROM (
+                    SELECT "Year", vid, MAX("DateVolunteered") AS last
+                    FROM df
+                    WHERE vid >= 0
+                    GROUP BY "Year", vid
+                )
+                GROUP BY "Year"
+                ORDER BY "Year"
+            """).df()
+
+        counts = counts.set_index("Year").astype({"total": "int64"})
+        counts.index = counts.index.astype(df_nt["Year"].dtype)
+    else:
+        raise ValueError(f"Unknown engine: {engine!r}")
+
+    total = counts["total"]
+    inactive = counts["inactive"].astype(int)
+    active = total - inactive
+
+    out = pd.DataFrame({
+        "Year": counts.index,
+        "Total Volunteers": total.values,
+        "Active Volunteers": active.values,
+        "Inactive Volunteers": inactive.values,
+        "Active (%)": (active / total * 100).values,
+        "Inactive (%)": (inactive / total * 100).values,
+    })
 
-    return pd.DataFrame(rows)
+    return out
 
 
-def compute_category_hours(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def compute_category_hours(
+    df: pd.DataFrame, engine: str = "cython", numba_parallel: bool = True
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     category_totals = (
         df.groupby("Category")["Hours"]
-        .sum()
+        .sum(**engine_kwargs(engine, numba_parallel))
         .reset_index()
         .rename(columns={"Hours": "TotalHours"})
         .sort_values("TotalHours", ascending=False)
@@ -278,7 +370,7 @@ def compute_category_hours(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame
 
     category_yearly = (
         df.groupby(["Year", "Category"])["Hours"]
-        .sum()
+        .sum(**engine_kwargs(engine, numba_parallel))
         .reset_index()
         .rename(columns={"Hours": "TotalHours"})
         .sort_values(["Year", "TotalHours"], ascending=[True, False])
@@ -287,12 +379,13 @@ def compute_category_hours(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame
     return category_totals, category_yearly
 
 
-def compute_trends(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    df_nt = df[df["Category"] != "Training"].copy()
-
+def compute_trends(
+    df: pd.DataFrame,
+    df_nt: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     active_by_year = df_nt.groupby("Year")["Volunteer ID"].nunique()
 
-    first_year = df_nt.groupby("Volunteer ID")["Year"].min()
+    first_year = df_nt.groupby("Volunteer ID", observed=True)["Year"].min()
     new_by_year = first_year.value_counts().sort_index()
     aligned_new = new_by_year.reindex(active_by_year.index, fill_value=0)
     returning_by_year = active_by_year - aligned_new
@@ -306,19 +399,50 @@ def compute_trends(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.Dat
     growth_explainer["% New"] = growth_explainer["NewVolunteers"] / growth_explainer["ActiveVolunteers"] * 100
     growth_explainer["% Returning"] = growth_explainer["ReturningVolunteers"] / growth_explainer["ActiveVolunteers"] * 100
 
-    # Seasonal average hours per volunteer
-    season_year_hours = df.groupby(["Year", "Season"])["Hours"].sum().unstack(fill_value=0)
-    season_year_vol = df.groupby(["Year", "Season"])["Volunteer ID"].nunique().unstack(fill_value=0)
-    season_avg = (season_year_hours / season_year_vol).fillna(0)
+    # Seasonal average hours per volunteer (long frame, one unstack for export)
+    season_long = df.groupby(["Year", "Season"], observed=True).agg(
+        h=("Hours", "sum"), v=("Volunteer ID", "nunique")
+    )
+    season_avg = (season_long["h"] / season_long["v"]).unstack("Season", fill_value=0)
 
     # Monthly average hours per volunteer
-    month_year_hours = df.groupby(["Year", "Month"])["Hours"].sum().unstack(fill_value=0)
-    month_year_vol = df.groupby(["Year", "Month"])["Volunteer ID"].nunique().unstack(fill_value=0)
-    month_avg = (month_year_hours / month_year_vol).reindex(columns=MONTH_ORDER).fillna(0)
+    month_long = df.groupby(["Year", "Month"], observed=True).agg(
+        h=("Hours", "sum"), v=("Volunteer ID", "nunique")
+    )
+    month_avg = (
+        (month_long["h"] / month_long["v"])
+        .unstack("Month", fill_value=0)
+        .reindex(columns=MONTH_ORDER, fill_value=0)
+    )
 
     return growth_explainer, season_avg, month_avg
 
 
+def compute_metrics(df_hours: pd.DataFrame, df_nt: pd.DataFrame, executor: str = "serial") -> tuple:
+    """Run the independent, read-only metrics serially or on a thread pool."""
+    if executor == "serial":
+        return (
+            compute_yearly_engagement(df_hours, engine=GROUPBY_ENGINE),
+            compute_top20_engagement(df_hours),
+            compute_retention_rolling_6mo(df_nt, engine=RETENTION_ENGINE),
+            compute_category_hours(df_hours, engine=GROUPBY_ENGINE),
+            compute_trends(df_hours, df_nt),
+        )
+
+    if executor == "threads":
+        # numba's parallel=True workqueue deadlocks when entered from several
+        # threads at once, so numba runs single-threaded inside the pool
+        with ThreadPoolExecutor() as pool:
+            yearly = pool.submit(compute_yearly_engagement, df_hours, GROUPBY_ENGINE, numba_parallel=False)
+            top20 = pool.submit(compute_top20_engagement, df_hours)
+            retention = pool.submit(compute_retention_rolling_6mo, df_nt, RETENTION_ENGINE)
+            category = pool.submit(compute_category_hours, df_hours, GROUPBY_ENGINE, numba_parallel=False)
+            trends = pool.submit(compute_trends, df_hours, df_nt)
+            return yearly.result(), top20.result(), retention.result(), category.result(), trends.result()
+
+    raise ValueError(f"Unknown metrics executor: {executor!r}")
+
+
 # -----------------------------
 # Optional: mapping stopped volunteers by FSA (safe aggregated)
 # -----------------------------
@@ -371,31 +495,52 @@ def export_all(
 ) -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    with pd.ExcelWriter(OUTPUT_FILE, engine="openpyxl", mode="w") as writer:
-        yearly_engagement.to_excel(writer, sheet_name="Yearly Engagement", index=False)
-        top20.to_excel(writer, sheet_name="Top 20% Concentration", index=False)
-        retention_6mo.to_excel(writer, sheet_name="Inactivity (Rolling 6mo)", index=False)
-        category_totals.to_excel(writer, sheet_name="Category Summary", index=False)
-        category_yearly.to_excel(writer, sheet_name="Category Trend", index=False)
-        growth_explainer.to_excel(writer, sheet_name="New vs Returning", index=False)
-        season_avg.to_excel(writer, sheet_name="Season Avg Hours", index=True)
-        month_avg.to_excel(writer, sheet_name="Month Avg Hours", index=True)
-
-        if fsa_gdf is not None:
-            # Store only the aggregated table (not geometry) for safety
-            safe_cols = ["FSA", "TotalVolunteers", "StoppedVolunteers", "StoppedPct"]
-            fsa_gdf[safe_cols].to_excel(writer, sheet_name="FSA Stopped Summary", index=False)
+    # sheet name -> (table, keep index)
+    sheets = {
+        "Yearly Engagement": (yearly_engagement, False),
+        "Top 20% Concentration": (top20, False),
+        "Inactivity (Rolling 6mo)": (retention_6mo, False),
+        "Category Summary": (category_totals, False),
+        "Category Trend": (category_yearly, False),
+        "New vs Returning": (growth_explainer, False),
+        "Season Avg Hours": (season_avg, True),
+        "Month Avg Hours": (month_avg, True),
+    }
+
+    if fsa_gdf is not None:
+        # Store only the aggregated table (not geometry) for safety
+        safe_cols = ["FSA", "TotalVolunteers", "StoppedVolunteers", "StoppedPct"]
+        sheets["FSA Stopped Summary"] = (pd.DataFrame(fsa_gdf[safe_cols]), False)
+
+    # Parquet copies (outputs/<sheet>.parquet) are written alongside the workbook
+    with ThreadPoolExecutor() as pool:
+        futures = [
+            pool.submit(write_parquet, table, OUTPUT_DIR, name, index)
+            for name, (table, index) in sheets.items()
+        ]
+
+        with pd.ExcelWriter(OUTPUT_FILE, engine="xlsxwriter", engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
+            for name, (table, index) in sheets.items():
+                table.to_excel(writer, sheet_name=name, index=index)
+
+        for future in futures:
+            future.result()
 
 
 def main() -> None:
     df_hours = load_and_clean_hours(HOURS_FILE)
     df_merged = merge_volunteer_data(df_hours, VOLUNTEER_FILE)
 
-    yearly_engagement = compute_yearly_engagement(df_hours)
-    top20 = compute_top20_engagement(df_hours)
-    retention_6mo = compute_retention_rolling_6mo(df_hours)
-    category_totals, category_yearly = compute_category_hours(df_hours)
-    growth_explainer, season_avg, month_avg = compute_trends(df_hours)
+    # Non-training view, filtered once and shared (metrics only read it)
+    df_nt = df_hours[df_hours["Category"] != "Training"]
+
+    (
+        yearly_engagement,
+        top20,
+        retention_6mo,
+        (category_totals, category_yearly),
+        (growth_explainer, season_avg, month_avg),
+    ) = compute_metrics(df_hours, df_nt, executor=METRICS_EXECUTOR)
 
     fsa_gdf = mapping_stopped_by_fsa(df_merged)
 